@@ -9,14 +9,52 @@ rm py-polars/README.md
 cp README.md py-polars/README.md
 cd py-polars
 rustup override set nightly-2022-07-24
+rustup component add llvm-tools-preview
 export RUSTFLAGS='-C target-feature=+fxsr,+sse,+sse2,+sse3,+ssse3,+sse4.1,+sse4.2,+popcnt,+avx,+fma'
 
+# profile guided optimization:
+# build an instrumented binary, run a fixed offline workload (.github/pgo_workload.py)
+# and merge the collected profiles for the default release build below.
+# pgo is best effort: if training fails the wheel is published without a profile.
+# thin lto is only used for these pgo builds; the shared release profile keeps fat lto
+export CARGO_PROFILE_RELEASE_LTO=thin
+BASE_RUSTFLAGS="$RUSTFLAGS"
+PGO_DIR=/tmp/pgo-data
+LLVM_PROFDATA=$(find "$(rustc --print sysroot)" -name llvm-profdata -type f | head -n 1)
+
+PGO_WORKLOAD="$(pwd)/../.github/pgo_workload.py"
+
+# the steps are chained explicitly, as `set -e` does not apply inside an `if` condition
+pgo_train() {
+  python3 -m venv /tmp/pgo-venv \
+    && /tmp/pgo-venv/bin/pip install -U pip maturin \
+    && RUSTFLAGS="$RUSTFLAGS -C profile-generate=$PGO_DIR" \
+      /tmp/pgo-venv/bin/maturin build --release -o /tmp/pgo-wheels \
+    && /tmp/pgo-venv/bin/pip install /tmp/pgo-wheels/polars-*.whl \
+    && (cd /tmp && /tmp/pgo-venv/bin/python "$PGO_WORKLOAD") \
+    && "$LLVM_PROFDATA" merge -o $PGO_DIR/merged.profdata $PGO_DIR \
+    && [ -s $PGO_DIR/merged.profdata ]
+}
+
+# the workload runs from another directory so that the installed (instrumented)
+# wheel is imported
+if pgo_train; then
+  export RUSTFLAGS="$RUSTFLAGS -C profile-use=$PGO_DIR/merged.profdata"
+else
+  # a failed run only yields a partial profile, so don't use it
+  echo "pgo: training failed, building the release without a profile" >&2
+  unset CARGO_PROFILE_RELEASE_LTO
+fi
+
 # first the default release
 maturin publish \
   --skip-existing \
   --username ritchie46
 
 # now compile polars with bigidx feature
+# this is a different binary than the one that was profiled, so don't apply the profile
+export RUSTFLAGS="$BASE_RUSTFLAGS"
+unset CARGO_PROFILE_RELEASE_LTO
 sed -i 's/name = "polars"/name = "polars-u64-idx"/' pyproject.toml
 # a brittle hack to insert the 'bigidx' feature
 sed -i 's/"dynamic_groupby",/"dynamic_groupby",\n"bigidx",/' Cargo.toml
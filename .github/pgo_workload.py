@@ -0,0 +1,90 @@
+"""
+Training workload for the profile guided optimization of the release wheels.
+
+Runs a small, fixed set of typical queries on generated data. It must stay offline
+and deterministic, see `deploy_manylinux.sh`.
+"""
+import io
+import random
+
+import polars as pl
+
+N = 1_000_000
+
+random.seed(0)
+df = pl.DataFrame(
+    {
+        "id": [random.randint(0, 10_000) for _ in range(N)],
+        "group": [random.choice(["a", "b", "c", "d", "e"]) for _ in range(N)],
+        "value": [random.random() for _ in range(N)],
+        "count": [random.randint(0, 100) for _ in range(N)],
+        "name": [f"name_{random.randint(0, 1000)}" for _ in range(N)],
+    }
+).with_columns(
+    [
+        pl.when(pl.col("count") % 10 == 0)
+        .then(None)
+        .otherwise(pl.col("value"))
+        .alias("value_nulls"),
+        pl.col("group").cast(pl.Categorical).alias("group_cat"),
+    ]
+)
+other = df.groupby("id").agg(pl.col("value").mean().alias("mean_value"))
+
+for _ in range(3):
+    # groupby aggregations
+    df.groupby("group").agg(
+        [pl.col("value").sum(), pl.col("count").mean(), pl.col("name").n_unique()]
+    )
+    df.groupby(["group", "id"]).agg(pl.col("value_nulls").max())
+    df.groupby("group_cat").agg(pl.col("value").quantile(0.5))
+
+    # joins
+    df.join(other, on="id", how="left")
+    df.join(other, on="id", how="inner")
+
+    # sorting, filtering and projections
+    df.sort(["group", "value"], reverse=[False, True])
+    df.filter((pl.col("value") > 0.5) & (pl.col("group") != "a"))
+    df.select(
+        [
+            (pl.col("value") * pl.col("count")).alias("product"),
+            pl.col("value_nulls").fill_null(0.0),
+            pl.col("name").str.contains("name_1").alias("contains"),
+            pl.col("name").str.lengths().alias("lengths"),
+            pl.col("value").rank().alias("rank"),
+            pl.col("value").sum().over("group").alias("group_sum"),
+        ]
+    )
+    df.unique(subset=["id", "group"])
+
+    # lazy queries through the optimizer
+    (
+        df.lazy()
+        .filter(pl.col("count") > 10)
+        .with_column((pl.col("value") * 2).alias("value2"))
+        .groupby("group")
+        .agg([pl.col("value2").sum(), pl.count()])
+        .sort("group")
+        .collect()
+    )
+
+    # rolling windows
+    df.select(
+        [
+            pl.col("value").rolling_mean(16).alias("rolling_mean"),
+            pl.col("value").rolling_max(16).alias("rolling_max"),
+            pl.col("value").cumsum().alias("cumsum"),
+        ]
+    )
+
+    # (de)serialization
+    for write, read in (
+        (pl.DataFrame.write_csv, pl.read_csv),
+        (pl.DataFrame.write_parquet, pl.read_parquet),
+        (pl.DataFrame.write_ipc, pl.read_ipc),
+    ):
+        buf = io.BytesIO()
+        write(df, buf)
+        buf.seek(0)
+        read(buf)
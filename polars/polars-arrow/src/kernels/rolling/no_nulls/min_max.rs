@@ -1,6 +1,7 @@
 use super::*;
 use no_nulls;
 use no_nulls::{rolling_apply_agg_window, RollingAggWindowNoNulls};
+use std::collections::VecDeque;
 
 pub struct SortedMinMax<'a, T: NativeType> {
     slice: &'a [T],
@@ -17,245 +18,108 @@ impl<'a, T: NativeType> RollingAggWindowNoNulls<'a, T> for SortedMinMax<'a, T> {
     }
 }
 
+/// Update a sliding window that keeps the indices of the candidate extrema in a deque.
+///
+/// The values the indices point to are ordered by `cmp`, so the front of the deque is
+/// the extremum of the window. Every index enters and leaves the deque once, which
+/// makes an update amortized O(1), regardless of the order of the values.
+///
+/// The windows must be non-empty and `start` and `end` may not decrease between updates.
+#[inline]
+unsafe fn update_monotonic<T, F>(
+    slice: &[T],
+    deque: &mut VecDeque<usize>,
+    last_end: &mut usize,
+    start: usize,
+    end: usize,
+    cmp: F,
+) -> T
+where
+    T: NativeType,
+    F: Fn(&T, &T) -> Ordering,
+{
+    // the window doesn't overlap with the previous one
+    if start >= *last_end {
+        deque.clear();
+        *last_end = start;
+    }
+
+    // add the entering values, dropping the candidates they supersede
+    for idx in *last_end..end {
+        let value = slice.get_unchecked(idx);
+        while let Some(&last) = deque.back() {
+            if cmp(slice.get_unchecked(last), value) == Ordering::Less {
+                break;
+            }
+            deque.pop_back();
+        }
+        deque.push_back(idx);
+    }
+    *last_end = end;
+
+    // remove the candidates that left the window
+    while let Some(&first) = deque.front() {
+        if first >= start {
+            break;
+        }
+        deque.pop_front();
+    }
+
+    debug_assert!(!deque.is_empty());
+    *slice.get_unchecked(*deque.front().unwrap_unchecked())
+}
+
 pub struct MinWindow<'a, T: NativeType + PartialOrd + IsFloat> {
     slice: &'a [T],
-    min: T,
-    last_start: usize,
+    deque: VecDeque<usize>,
     last_end: usize,
 }
 
 impl<'a, T: NativeType + IsFloat + PartialOrd> RollingAggWindowNoNulls<'a, T> for MinWindow<'a, T> {
     fn new(slice: &'a [T], start: usize, end: usize) -> Self {
-        let min = *slice[start..end]
-            .iter()
-            .min_by(|a, b| compare_fn_nan_min(*a, *b))
-            .unwrap_or(&slice[start]);
         Self {
             slice,
-            min,
-            last_start: start,
-            last_end: end,
+            deque: VecDeque::with_capacity(end - start),
+            last_end: start,
         }
     }
 
     unsafe fn update(&mut self, start: usize, end: usize) -> T {
-        // recompute min
-        if start >= self.last_end {
-            self.min = *self
-                .slice
-                .get_unchecked(start..end)
-                .iter()
-                .min_by(|a, b| compare_fn_nan_min(*a, *b))
-                .unwrap_or(&self.slice[start]);
-
-            self.last_start = start;
-            self.last_end = end;
-
-            return self.min;
-        }
-
-        let mut recompute_min = false;
-        // remove elements that should leave the window
-        for idx in self.last_start..start {
-            // safety
-            // we are in bounds
-            let leaving_value = self.slice.get_unchecked(idx);
-
-            // if the leaving value is the
-            // max value, we need to recompute the max.
-            if matches!(
-                compare_fn_nan_min(leaving_value, &self.min),
-                Ordering::Equal
-            ) {
-                recompute_min = true;
-                break;
-            }
-        }
-
-        let entering_min = self
-            .slice
-            .get_unchecked(self.last_end..end)
-            .iter()
-            .min_by(|a, b| compare_fn_nan_min(*a, *b))
-            .unwrap_or(
-                &self.slice[std::cmp::max(self.last_start, self.last_end.saturating_sub(1))],
-            );
-
-        if recompute_min {
-            match compare_fn_nan_min(&self.min, entering_min) {
-                // do nothing
-                Ordering::Equal => {}
-                // leaving < entering
-                Ordering::Less => {
-                    // leaving value could be the smallest, we might need to recompute
-
-                    // check the values in between the window we did not yet
-                    // compute to find the max there. We compare that with the `entering_max`
-                    // if any value is equal to equal to `self.max` of previous window we can break
-                    // early
-                    let mut min_in_between = self.slice.get_unchecked(start);
-                    for idx in (start + 1)..self.last_end {
-                        // safety
-                        // we are in bounds
-                        let value = self.slice.get_unchecked(idx);
-
-                        if matches!(compare_fn_nan_min(value, min_in_between), Ordering::Less) {
-                            min_in_between = value;
-                        }
-
-                        // the min is also in the in between values
-                        if matches!(compare_fn_nan_min(value, &self.min), Ordering::Equal) {
-                            self.last_start = start;
-                            self.last_end = end;
-                            return self.min;
-                        }
-                    }
-
-                    if matches!(
-                        compare_fn_nan_min(min_in_between, entering_min),
-                        Ordering::Less
-                    ) {
-                        self.min = *min_in_between
-                    } else {
-                        self.min = *entering_min
-                    }
-                }
-                // leaving > entering
-                Ordering::Greater => {
-                    if matches!(compare_fn_nan_min(entering_min, &self.min), Ordering::Less) {
-                        self.min = *entering_min
-                    }
-                }
-            }
-        } else if matches!(compare_fn_nan_min(entering_min, &self.min), Ordering::Less) {
-            self.min = *entering_min
-        }
-
-        self.last_start = start;
-        self.last_end = end;
-        self.min
+        update_monotonic(
+            self.slice,
+            &mut self.deque,
+            &mut self.last_end,
+            start,
+            end,
+            compare_fn_nan_min,
+        )
     }
 }
 
 pub struct MaxWindow<'a, T: NativeType> {
     slice: &'a [T],
-    max: T,
-    last_start: usize,
+    deque: VecDeque<usize>,
     last_end: usize,
 }
 
 impl<'a, T: NativeType + IsFloat + PartialOrd> RollingAggWindowNoNulls<'a, T> for MaxWindow<'a, T> {
     fn new(slice: &'a [T], start: usize, end: usize) -> Self {
-        let max = *slice[start..end]
-            .iter()
-            .max_by(|a, b| compare_fn_nan_max(*a, *b))
-            .unwrap_or(&slice[start]);
         Self {
             slice,
-            max,
-            last_start: start,
-            last_end: end,
+            deque: VecDeque::with_capacity(end - start),
+            last_end: start,
         }
     }
 
     unsafe fn update(&mut self, start: usize, end: usize) -> T {
-        // recompute max
-        if start >= self.last_end {
-            self.max = *self
-                .slice
-                .get_unchecked(start..end)
-                .iter()
-                .max_by(|a, b| compare_fn_nan_max(*a, *b))
-                .unwrap_or(&self.slice[start]);
-
-            self.last_start = start;
-            self.last_end = end;
-
-            return self.max;
-        }
-
-        let mut recompute_max = false;
-        for idx in self.last_start..start {
-            // safety
-            // we are in bounds
-            let leaving_value = self.slice.get_unchecked(idx);
-            // if the leaving value is the max value, we need to recompute the max.
-            if matches!(
-                compare_fn_nan_max(leaving_value, &self.max),
-                Ordering::Equal
-            ) {
-                recompute_max = true;
-                break;
-            }
-        }
-
-        let entering_max = self
-            .slice
-            .get_unchecked(self.last_end..end)
-            .iter()
-            .max_by(|a, b| compare_fn_nan_max(*a, *b))
-            .unwrap_or(
-                &self.slice[std::cmp::max(self.last_start, self.last_end.saturating_sub(1))],
-            );
-
-        if recompute_max {
-            match compare_fn_nan_max(&self.max, entering_max) {
-                // do nothing
-                Ordering::Equal => {}
-                // leaving < entering
-                Ordering::Less => {
-                    if matches!(
-                        compare_fn_nan_max(entering_max, &self.max),
-                        Ordering::Greater
-                    ) {
-                        self.max = *entering_max
-                    }
-                }
-                // leaving > entering
-                Ordering::Greater => {
-                    // leaving value could be the largest, we might need to recompute
-
-                    // check the values in between the window we did not yet
-                    // compute to find the max there. We compare that with the `entering_max`
-                    // if any value is equal to equal to `self.max` of previous window we can break
-                    // early
-                    let mut max_in_between = self.slice.get_unchecked(start);
-                    for idx in (start + 1)..self.last_end {
-                        // safety
-                        // we are in bounds
-                        let value = self.slice.get_unchecked(idx);
-
-                        if matches!(compare_fn_nan_max(value, max_in_between), Ordering::Greater) {
-                            max_in_between = value;
-                        }
-
-                        // the max is also in the in between values
-                        if matches!(compare_fn_nan_max(value, &self.max), Ordering::Equal) {
-                            self.last_start = start;
-                            self.last_end = end;
-                            return self.max;
-                        }
-                    }
-
-                    if matches!(
-                        compare_fn_nan_max(max_in_between, entering_max),
-                        Ordering::Greater
-                    ) {
-                        self.max = *max_in_between
-                    } else {
-                        self.max = *entering_max
-                    }
-                }
-            }
-        } else if matches!(
-            compare_fn_nan_max(entering_max, &self.max),
-            Ordering::Greater
-        ) {
-            self.max = *entering_max
-        }
-        self.last_start = start;
-        self.last_end = end;
-        self.max
+        update_monotonic(
+            self.slice,
+            &mut self.deque,
+            &mut self.last_end,
+            start,
+            end,
+            |a, b| compare_fn_nan_max(b, a),
+        )
     }
 }
 
@@ -310,7 +174,8 @@ where
 {
     match (center, weights) {
         (true, None) => {
-            // will be O(n2) if we don't take this path we hope that we hit an early return on not sorted data
+            // sorted data can skip the window state, we hope that we hit an early return on
+            // not sorted data
             if is_reverse_sorted_max(values) {
                 rolling_apply_agg_window::<SortedMinMax<_>, _, _>(
                     values,
@@ -405,7 +270,8 @@ where
 {
     match (center, weights) {
         (true, None) => {
-            // will be O(n2) if we don't take this path we hope that we hit an early return on not sorted data
+            // sorted data can skip the window state, we hope that we hit an early return on
+            // not sorted data
             if is_sorted_min(values) {
                 rolling_apply_agg_window::<SortedMinMax<_>, _, _>(
                     values,
@@ -423,7 +289,7 @@ where
             }
         }
         (false, None) => {
-            // will be O(n2)
+            // sorted data can skip the window state
             if is_reverse_sorted_max(values) {
                 rolling_apply_agg_window::<SortedMinMax<_>, _, _>(
                     values,
@@ -551,4 +417,22 @@ mod test {
             )
         );
     }
+
+    #[test]
+    fn test_rolling_min_max_windows() {
+        let values = &[4i32, 1, 7, 3, 3, 9, 2, 8, 5, 6];
+        // overlapping windows of varying length, followed by a window that doesn't
+        // overlap with the previous one
+        let windows = [(0, 3), (0, 4), (2, 5), (3, 6), (3, 8), (7, 8), (8, 10)];
+
+        let mut min_window = MinWindow::new(values, 0, 0);
+        let mut max_window = MaxWindow::new(values, 0, 0);
+        for (start, end) in windows {
+            let window = &values[start..end];
+            unsafe {
+                assert_eq!(min_window.update(start, end), *window.iter().min().unwrap());
+                assert_eq!(max_window.update(start, end), *window.iter().max().unwrap());
+            }
+        }
+    }
 }
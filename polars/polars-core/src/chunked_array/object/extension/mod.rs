@@ -8,6 +8,24 @@ use arrow::bitmap::MutableBitmap;
 use arrow::buffer::Buffer;
 use polars_extension::PolarsExtension;
 use std::mem;
+use std::sync::atomic::{AtomicBool, Ordering};
+
+const ALLOW_EXTENSION_ENV: &str = "POLARS_ALLOW_EXTENSION";
+
+/// Set once `POLARS_ALLOW_EXTENSION` is found, so that the env var is not read
+/// again on every extension creation.
+static EXTENSION_ALLOWED: AtomicBool = AtomicBool::new(false);
+
+fn extension_allowed() -> bool {
+    if EXTENSION_ALLOWED.load(Ordering::Relaxed) {
+        return true;
+    }
+    let allowed = std::env::var(ALLOW_EXTENSION_ENV).is_ok();
+    if allowed {
+        EXTENSION_ALLOWED.store(true, Ordering::Relaxed);
+    }
+    allowed
+}
 
 /// Invariants
 /// `ptr` must point to start a `T` allocation
@@ -51,13 +69,12 @@ pub(crate) fn create_extension<
 >(
     iter: I,
 ) -> PolarsExtension {
-    let env = "POLARS_ALLOW_EXTENSION";
-    std::env::var(env).unwrap_or_else(|_| {
+    if !extension_allowed() {
         panic!(
             "env var: {} must be set to allow extension types to be created",
-            env
+            ALLOW_EXTENSION_ENV
         )
-    });
+    }
     let t_size = std::mem::size_of::<T>();
     let t_alignment = std::mem::align_of::<T>();
     let n_t_vals = iter.size_hint().1.unwrap();
@@ -28,6 +28,64 @@ pub(crate) fn prepare_projection(exprs: Vec<Expr>, schema: &Schema) -> Result<(V
     Ok((exprs, schema))
 }
 
+/// Check if a predicate only consists of elementwise expressions, e.g. no aggregations,
+/// window functions or literal Series, which depend on all rows of the input.
+///
+/// The expressions must also not be able to raise, e.g. a strict `Cast`: after folding
+/// they run on the rows the previous filter drops, which may be exactly what that
+/// filter guards against.
+fn is_elementwise_predicate(predicate: &Expr) -> bool {
+    predicate.into_iter().all(|e| match e {
+        Expr::Literal(lv) => !matches!(lv, LiteralValue::Series(_) | LiteralValue::Range { .. }),
+        // integer division by zero panics
+        Expr::BinaryExpr { op, .. } => !matches!(op, Operator::Divide | Operator::Modulus),
+        Expr::Alias(_, _)
+        | Expr::Column(_)
+        | Expr::Not(_)
+        | Expr::IsNotNull(_)
+        | Expr::IsNull(_)
+        | Expr::Ternary { .. }
+        | Expr::KeepName(_) => true,
+        _ => false,
+    })
+}
+
+/// Check if `exprs` can be added to the `HStack` at the root of `lp`, which is only valid
+/// if they don't use or overwrite any of the columns that `HStack` adds.
+///
+/// This only does schema lookups for the new expressions, so that fusing a long chain
+/// of `with_column` calls stays linear in the number of expressions.
+fn can_fuse_hstack(lp: &LogicalPlan, exprs: &[Expr], output_names: &[String]) -> bool {
+    match lp {
+        LogicalPlan::HStack {
+            input,
+            exprs: previous,
+            schema,
+        } => {
+            let input_schema = match input.schema() {
+                Ok(schema) => schema,
+                Err(_) => return false,
+            };
+            // if every previous expression added a new column, the added columns are
+            // exactly those in `schema` that are not in `input_schema`. Otherwise some
+            // input column was overwritten, which a lookup by name can't detect.
+            if schema.len() != input_schema.len() + previous.len() {
+                return false;
+            }
+            let is_added =
+                |name: &str| schema.get(name).is_some() && input_schema.get(name).is_none();
+
+            output_names.iter().all(|name| !is_added(name.as_str()))
+                && exprs.iter().all(|e| {
+                    utils::expr_to_root_column_names(e)
+                        .iter()
+                        .all(|name| !is_added(&**name))
+                })
+        }
+        _ => false,
+    }
+}
+
 pub struct LogicalPlanBuilder(LogicalPlan);
 
 impl From<LogicalPlan> for LogicalPlanBuilder {
@@ -295,15 +353,34 @@ impl LogicalPlanBuilder {
         let mut new_schema = (**schema).clone();
         let (exprs, _) = try_delayed!(prepare_projection(exprs, &schema), &self.0, into);
 
+        let mut output_names = Vec::with_capacity(exprs.len());
         for e in &exprs {
             let field = e.to_field(&schema, Context::Default).unwrap();
             new_schema.with_column(field.name().to_string(), field.data_type().clone());
+            output_names.push(field.name);
         }
-
-        LogicalPlan::HStack {
-            input: Box::new(self.0),
-            exprs,
-            schema: Arc::new(new_schema),
+        let fuse = can_fuse_hstack(&self.0, &exprs, &output_names);
+
+        match self.0 {
+            // fuse consecutive `with_columns` into a single `HStack`. The new expressions
+            // are then evaluated on the input of the previous `HStack`.
+            LogicalPlan::HStack {
+                input,
+                exprs: mut previous,
+                ..
+            } if fuse => {
+                previous.extend(exprs);
+                LogicalPlan::HStack {
+                    input,
+                    exprs: previous,
+                    schema: Arc::new(new_schema),
+                }
+            }
+            lp => LogicalPlan::HStack {
+                input: Box::new(lp),
+                exprs,
+                schema: Arc::new(new_schema),
+            },
         }
         .into()
     }
@@ -344,9 +421,21 @@ impl LogicalPlanBuilder {
         } else {
             predicate
         };
-        LogicalPlan::Selection {
-            predicate,
-            input: Box::new(self.0),
+        match self.0 {
+            // fold consecutive filters into a single predicate. The new predicate is
+            // then evaluated on the input of the previous filter, so this is only valid
+            // if its result for a row does not depend on the other rows.
+            LogicalPlan::Selection {
+                input,
+                predicate: previous,
+            } if is_elementwise_predicate(&predicate) => LogicalPlan::Selection {
+                predicate: previous.and(predicate),
+                input,
+            },
+            lp => LogicalPlan::Selection {
+                predicate,
+                input: Box::new(lp),
+            },
         }
         .into()
     }
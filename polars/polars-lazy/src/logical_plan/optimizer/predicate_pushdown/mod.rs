@@ -399,6 +399,13 @@ impl PredicatePushDown {
                 let mut pushdown_right = optimizer::init_hashmap(Some(acc_predicates.len()));
                 let mut local_predicates = Vec::with_capacity(acc_predicates.len());
 
+                // an asof join matches the nearest key, filtering the right table would
+                // change which row is matched.
+                #[cfg(feature = "asof_join")]
+                let pushdown_right_allowed = !matches!(&options.how, JoinType::AsOf(_));
+                #[cfg(not(feature = "asof_join"))]
+                let pushdown_right_allowed = true;
+
                 for (_, predicate) in acc_predicates {
                     // unique and duplicated can be caused by joins
                     let matches =
@@ -436,7 +443,9 @@ impl PredicatePushDown {
                             filter_left = true;
                         }
 
-                        if check_input_node(predicate, &schema_right, expr_arena)  {
+                        if pushdown_right_allowed
+                            && check_input_node(predicate, &schema_right, expr_arena)
+                        {
                             let name = get_insertion_name(expr_arena, predicate, &schema_right);
                             insert_and_combine_predicate(
                                 &mut pushdown_right,
@@ -237,3 +237,91 @@ fn test_predicate_pd_apply() -> Result<()> {
     assert!(predicate_at_scan(q.clone()));
     Ok(())
 }
+
+#[test]
+fn test_fold_consecutive_filters() -> Result<()> {
+    let df = df![
+        "a" => [1, 2, 3],
+        "b" => [3, 2, 1]
+    ]?;
+
+    let lf = df
+        .lazy()
+        .filter(col("a").gt(lit(1)))
+        .filter(col("b").gt(lit(1)));
+    // elementwise predicates are folded into a single filter
+    assert!(matches!(
+        &lf.logical_plan,
+        LogicalPlan::Selection { input, .. } if !matches!(**input, LogicalPlan::Selection { .. })
+    ));
+
+    // an aggregation depends on the rows that are left by the previous filter
+    let lf = lf.filter(col("a").eq(col("a").max()));
+    assert!(matches!(
+        &lf.logical_plan,
+        LogicalPlan::Selection { input, .. } if matches!(**input, LogicalPlan::Selection { .. })
+    ));
+
+    let out = lf.collect()?;
+    assert_eq!(out.column("a")?.i32()?.get(0), Some(2));
+    assert_eq!(out.height(), 1);
+
+    Ok(())
+}
+
+#[test]
+fn test_no_fold_guarded_cast_filter() -> Result<()> {
+    let df = df![
+        "a" => ["1", "x", "3"]
+    ]?;
+
+    // the strict cast would fail on the row the first filter removes
+    let lf = df
+        .lazy()
+        .filter(col("a").neq(lit("x")))
+        .filter(col("a").strict_cast(DataType::Int32).gt(lit(1)));
+    assert!(matches!(
+        &lf.logical_plan,
+        LogicalPlan::Selection { input, .. } if matches!(**input, LogicalPlan::Selection { .. })
+    ));
+
+    let out = lf.with_predicate_pushdown(false).collect()?;
+    assert_eq!(Vec::from(out.column("a")?.utf8()?), &[Some("3")]);
+
+    Ok(())
+}
+
+#[test]
+#[cfg(feature = "asof_join")]
+fn test_no_right_pushdown_asof_join() -> Result<()> {
+    let left = df![
+        "t" => [1i64, 3, 5]
+    ]?;
+    let right = df![
+        "t" => [0i64, 2, 4],
+        "v" => [10i32, 20, 30]
+    ]?;
+
+    let out = left
+        .lazy()
+        .join(
+            right.lazy(),
+            [col("t")],
+            [col("t")],
+            JoinType::AsOf(AsOfOptions {
+                strategy: AsofStrategy::Backward,
+                tolerance: None,
+                tolerance_str: None,
+                left_by: None,
+                right_by: None,
+            }),
+        )
+        // filtering the right table first would match t == 5 with v == 20
+        .filter(col("v").lt(lit(25)))
+        .collect()?;
+
+    assert_eq!(Vec::from(out.column("t")?.i64()?), &[Some(1), Some(3)]);
+    assert_eq!(Vec::from(out.column("v")?.i32()?), &[Some(10), Some(20)]);
+
+    Ok(())
+}
@@ -124,3 +124,54 @@ fn concat_str_regex_expansion() -> Result<()> {
 
     Ok(())
 }
+
+#[test]
+fn test_fuse_consecutive_with_columns() -> Result<()> {
+    let df = df![
+        "a" => [1, 2, 3],
+        "b" => [3, 2, 1]
+    ]?;
+
+    let lf = df
+        .clone()
+        .lazy()
+        .with_column((col("a") * lit(2)).alias("c"))
+        .with_column((col("b") * lit(2)).alias("d"));
+    // independent columns are added by a single `HStack`
+    assert!(matches!(
+        &lf.logical_plan,
+        LogicalPlan::HStack { input, exprs, .. }
+            if exprs.len() == 2 && !matches!(**input, LogicalPlan::HStack { .. })
+    ));
+
+    // a column that uses the output of the previous `HStack` needs its own node
+    let lf = lf.with_column((col("c") + lit(1)).alias("e"));
+    assert!(matches!(
+        &lf.logical_plan,
+        LogicalPlan::HStack { input, .. } if matches!(**input, LogicalPlan::HStack { .. })
+    ));
+
+    let out = lf.collect()?;
+    assert_eq!(out.get_column_names(), &["a", "b", "c", "d", "e"]);
+    assert_eq!(
+        Vec::from(out.column("e")?.i32()?),
+        &[Some(3), Some(5), Some(7)]
+    );
+
+    // an overwritten input column must not be read by a fused expression
+    let lf = df
+        .lazy()
+        .with_column((col("a") * lit(2)).alias("a"))
+        .with_column((col("a") + lit(1)).alias("f"));
+    assert!(matches!(
+        &lf.logical_plan,
+        LogicalPlan::HStack { input, .. } if matches!(**input, LogicalPlan::HStack { .. })
+    ));
+    let out = lf.collect()?;
+    assert_eq!(
+        Vec::from(out.column("f")?.i32()?),
+        &[Some(3), Some(5), Some(7)]
+    );
+
+    Ok(())
+}
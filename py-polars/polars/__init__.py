@@ -1,136 +1,143 @@
+from __future__ import annotations
+
+import os
 import warnings
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Sequence
+
+# must be set before the binary is loaded; respects a value set by the user
+os.environ.setdefault("POLARS_ALLOW_EXTENSION", "true")
 
 try:
-    from polars.polars import version
+    from polars.polars import __version__ as _version
 except ImportError:
-
-    def version() -> str:
-        return ""
-
+    _version = ""
     # this is only useful for documentation
     warnings.warn("polars binary missing!")
 
-from polars import testing
-from polars.cfg import Config
-from polars.convert import (
-    from_arrow,
-    from_dict,
-    from_dicts,
-    from_numpy,
-    from_pandas,
-    from_records,
-)
-from polars.datatypes import (
-    Boolean,
-    Categorical,
-    DataType,
-    Date,
-    Datetime,
-    Duration,
-    Field,
-    Float32,
-    Float64,
-    Int8,
-    Int16,
-    Int32,
-    Int64,
-    List,
-    Null,
-    Object,
-    PolarsDataType,
-    Struct,
-    Time,
-    UInt8,
-    UInt16,
-    UInt32,
-    UInt64,
-    Utf8,
-    get_idx_type,
-)
-from polars.exceptions import (
-    ArrowError,
-    ComputeError,
-    DuplicateError,
-    NoDataError,
-    NotFoundError,
-    PanicException,
-    SchemaError,
-    ShapeError,
-)
-from polars.internals.expr import Expr
+from polars.cfg import Config  # noqa: E402
 
-# TODO remove need for wrap_df
-from polars.internals.frame import wrap_df  # noqa: F401
-from polars.internals.frame import DataFrame
-from polars.internals.functions import concat, cut, date_range, get_dummies
-from polars.internals.io import read_ipc_schema, read_parquet_schema
-from polars.internals.lazy_frame import LazyFrame
-from polars.internals.lazy_functions import _date as date
-from polars.internals.lazy_functions import _datetime as datetime
-from polars.internals.lazy_functions import (
-    all,
-    any,
-    apply,
-    arange,
-    arg_where,
-    argsort_by,
-    avg,
-    col,
-    collect_all,
-    concat_list,
-    concat_str,
-    count,
-    cov,
-    duration,
-    element,
-    exclude,
-    first,
-    fold,
-    format,
-    groups,
-    head,
-    last,
-    lit,
-    map,
-    max,
-    mean,
-    median,
-    min,
-    n_unique,
-    pearson_corr,
-    quantile,
-    repeat,
-    select,
-    spearman_rank_corr,
-    std,
-    struct,
-    sum,
-    tail,
-)
-from polars.internals.lazy_functions import to_list as list
-from polars.internals.lazy_functions import var
+if TYPE_CHECKING:
+    from polars import exceptions, testing
+    from polars.convert import (
+        from_arrow,
+        from_dict,
+        from_dicts,
+        from_numpy,
+        from_pandas,
+        from_records,
+    )
+    from polars.datatypes import (
+        Boolean,
+        Categorical,
+        DataType,
+        Date,
+        Datetime,
+        Duration,
+        Field,
+        Float32,
+        Float64,
+        Int8,
+        Int16,
+        Int32,
+        Int64,
+        List,
+        Null,
+        Object,
+        PolarsDataType,
+        Struct,
+        Time,
+        UInt8,
+        UInt16,
+        UInt32,
+        UInt64,
+        Utf8,
+        get_idx_type,
+    )
+    from polars.exceptions import (
+        ArrowError,
+        ComputeError,
+        DuplicateError,
+        NoDataError,
+        NotFoundError,
+        PanicException,
+        SchemaError,
+        ShapeError,
+    )
+    from polars.internals.expr import Expr
 
-# TODO: remove need for wrap_s
-from polars.internals.series import wrap_s  # noqa: F401
-from polars.internals.series import Series
-from polars.internals.whenthen import when
-from polars.io import (
-    read_avro,
-    read_csv,
-    read_excel,
-    read_ipc,
-    read_json,
-    read_parquet,
-    read_sql,
-    scan_csv,
-    scan_ds,
-    scan_ipc,
-    scan_parquet,
-)
-from polars.string_cache import StringCache, toggle_string_cache
-from polars.utils import threadpool_size
+    # TODO remove need for wrap_df
+    from polars.internals.frame import wrap_df  # noqa: F401
+    from polars.internals.frame import DataFrame
+    from polars.internals.functions import concat, cut, date_range, get_dummies
+    from polars.internals.io import read_ipc_schema, read_parquet_schema
+    from polars.internals.lazy_frame import LazyFrame
+    from polars.internals.lazy_functions import _date as date
+    from polars.internals.lazy_functions import _datetime as datetime
+    from polars.internals.lazy_functions import (
+        all,
+        any,
+        apply,
+        arange,
+        arg_where,
+        argsort_by,
+        avg,
+        col,
+        collect_all,
+        concat_list,
+        concat_str,
+        count,
+        cov,
+        duration,
+        element,
+        exclude,
+        first,
+        fold,
+        format,
+        groups,
+        head,
+        last,
+        lit,
+        map,
+        max,
+        mean,
+        median,
+        min,
+        n_unique,
+        pearson_corr,
+        quantile,
+        repeat,
+        select,
+        spearman_rank_corr,
+        std,
+        struct,
+        sum,
+        tail,
+    )
+    from polars.internals.lazy_functions import to_list as list
+    from polars.internals.lazy_functions import var
+
+    # TODO: remove need for wrap_s
+    from polars.internals.series import wrap_s  # noqa: F401
+    from polars.internals.series import Series
+    from polars.internals.whenthen import when
+    from polars.io import (
+        read_avro,
+        read_csv,
+        read_excel,
+        read_ipc,
+        read_json,
+        read_parquet,
+        read_sql,
+        scan_csv,
+        scan_ds,
+        scan_ipc,
+        scan_parquet,
+    )
+    from polars.string_cache import StringCache, toggle_string_cache
+    from polars.utils import threadpool_size
 
-__all__ = [
+__all__ = (
     "exceptions",
     "NotFoundError",
     "ShapeError",
@@ -238,7 +245,6 @@ __all__ = [
     "date",  # name _date, see import above
     "list",  # named to_list, see import above
     "select",
-    "var",
     "struct",
     "duration",
     # polars.convert
@@ -251,10 +257,180 @@ __all__ = [
     # testing
     "testing",
     "threadpool_size",
-]
+)
 
-__version__ = version()
 
-import os
+__version__: str = _version
+
+# Everything re-exported from a submodule is resolved lazily on first attribute access
+# (PEP 562), so `import polars` only pays for the subsystems that are actually used.
+# Maps the public name to the module that defines it.
+_LAZY_IMPORTS: dict[str, str] = {}
+for _module, _names in (
+    (
+        "polars.convert",
+        (
+            "from_arrow",
+            "from_dict",
+            "from_dicts",
+            "from_numpy",
+            "from_pandas",
+            "from_records",
+        ),
+    ),
+    (
+        "polars.datatypes",
+        (
+            "Boolean",
+            "Categorical",
+            "DataType",
+            "Date",
+            "Datetime",
+            "Duration",
+            "Field",
+            "Float32",
+            "Float64",
+            "Int8",
+            "Int16",
+            "Int32",
+            "Int64",
+            "List",
+            "Null",
+            "Object",
+            "PolarsDataType",
+            "Struct",
+            "Time",
+            "UInt8",
+            "UInt16",
+            "UInt32",
+            "UInt64",
+            "Utf8",
+            "get_idx_type",
+        ),
+    ),
+    (
+        "polars.exceptions",
+        (
+            "ArrowError",
+            "ComputeError",
+            "DuplicateError",
+            "NoDataError",
+            "NotFoundError",
+            "PanicException",
+            "SchemaError",
+            "ShapeError",
+        ),
+    ),
+    ("polars.internals.expr", ("Expr",)),
+    ("polars.internals.frame", ("DataFrame", "wrap_df")),
+    ("polars.internals.functions", ("concat", "cut", "date_range", "get_dummies")),
+    ("polars.internals.io", ("read_ipc_schema", "read_parquet_schema")),
+    ("polars.internals.lazy_frame", ("LazyFrame",)),
+    (
+        "polars.internals.lazy_functions",
+        (
+            "all",
+            "any",
+            "apply",
+            "arange",
+            "arg_where",
+            "argsort_by",
+            "avg",
+            "col",
+            "collect_all",
+            "concat_list",
+            "concat_str",
+            "count",
+            "cov",
+            "duration",
+            "element",
+            "exclude",
+            "first",
+            "fold",
+            "format",
+            "groups",
+            "head",
+            "last",
+            "lit",
+            "map",
+            "max",
+            "mean",
+            "median",
+            "min",
+            "n_unique",
+            "pearson_corr",
+            "quantile",
+            "repeat",
+            "select",
+            "spearman_rank_corr",
+            "std",
+            "struct",
+            "sum",
+            "tail",
+            "var",
+            # exported under a different name, see `_RENAMED` below
+            "date",
+            "datetime",
+            "list",
+        ),
+    ),
+    ("polars.internals.series", ("Series", "wrap_s")),
+    ("polars.internals.whenthen", ("when",)),
+    (
+        "polars.io",
+        (
+            "read_avro",
+            "read_csv",
+            "read_excel",
+            "read_ipc",
+            "read_json",
+            "read_parquet",
+            "read_sql",
+            "scan_csv",
+            "scan_ds",
+            "scan_ipc",
+            "scan_parquet",
+        ),
+    ),
+    ("polars.string_cache", ("StringCache", "toggle_string_cache")),
+    ("polars.utils", ("threadpool_size",)),
+):
+    for _name in _names:
+        _LAZY_IMPORTS[_name] = _module
+del _module, _names, _name
+
+# public names that are defined under another name in their source module
+_RENAMED = {"date": "_date", "datetime": "_datetime", "list": "to_list"}
+
+# submodules that are exported as attributes, as they were when `import polars`
+# still imported everything eagerly
+_SUBMODULES = frozenset(
+    (
+        "cfg",
+        "convert",
+        "datatypes",
+        "datatypes_constructor",
+        "exceptions",
+        "internals",
+        "io",
+        "string_cache",
+        "testing",
+        "utils",
+    )
+)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _SUBMODULES:
+        value: Any = import_module(f"polars.{name}")
+    elif name in _LAZY_IMPORTS:
+        value = getattr(import_module(_LAZY_IMPORTS[name]), _RENAMED.get(name, name))
+    else:
+        raise AttributeError(f"module 'polars' has no attribute '{name}'")
+    # cache on the module so that `__getattr__` is only hit once per name
+    globals()[name] = value
+    return value
+
 
-os.environ["POLARS_ALLOW_EXTENSION"] = "true"
+def __dir__() -> Sequence[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS) | _SUBMODULES)
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import glob
 import pickle
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
+from typing import Callable
+from urllib.parse import urlsplit
 
 import polars as pl
 from polars import internals as pli
@@ -13,6 +17,13 @@ try:
 except ImportError:
     _PYARROW_AVAILABLE = False
 
+try:
+    import fsspec
+
+    _WITH_FSSPEC = True
+except ImportError:
+    _WITH_FSSPEC = False
+
 
 def _deser_and_exec(buf: bytes, with_columns: list[str] | None) -> pli.DataFrame:
     """
@@ -74,63 +85,145 @@ def _scan_ds(ds: pa.dataset.dataset) -> pli.LazyFrame:
     return pli.LazyFrame._scan_python_function(ds.schema, func_serialized)
 
 
-def _scan_ipc_impl(uri: str, with_columns: list[str] | None) -> pli.DataFrame:
+def _expand_fsspec_glob(
+    file: str, storage_options: dict[str, object]
+) -> str | list[str]:
+    """
+    Expand a remote glob pattern into the URIs of the files it matches.
+
+    Paths without a glob pattern are returned unchanged.
+    """
+    # only the path may contain a pattern; a `?` in a query string is not one
+    if not _WITH_FSSPEC or not glob.has_magic(urlsplit(file).path):
+        return file
+    fs, path = fsspec.core.url_to_fs(file, **storage_options)
+    # a key can contain a literal `[` or `*`; an existing file takes precedence
+    if fs.exists(path):
+        return file
+    paths = sorted(fs.glob(path))
+    if not paths:
+        raise FileNotFoundError(f"no files found matching: {file}")
+    return [fs.unstrip_protocol(p) for p in paths]
+
+
+def _read_files(read: Callable[[str], pli.DataFrame], uris: list[str]) -> pli.DataFrame:
+    """
+    Read multiple files and concatenate them vertically.
+
+    The reads are issued concurrently, as the latency of remote IO dominates.
+    """
+    with ThreadPoolExecutor() as pool:
+        dfs = list(pool.map(read, uris))
+    return pli.concat(dfs, rechunk=False)
+
+
+def _scan_ipc_impl(
+    uri: str | list[str],
+    n_rows: int | None,
+    storage_options: dict[str, object],
+    with_columns: list[str] | None,
+) -> pli.DataFrame:
     """
     Take the projected columns and materialize an arrow table.
 
     Parameters
     ----------
     uri
-        Source URI
+        Source URI, or the URIs of all files matched by a glob pattern
+    n_rows
+        Stop reading after ``n_rows``
+    storage_options
+        Extra options passed to fsspec when reading the file(s)
     with_columns
         Columns that are projected
 
     """
     import polars as pl
 
-    return pl.read_ipc(uri, with_columns)
+    if isinstance(uri, list):
+        read = partial(
+            pl.read_ipc,
+            columns=with_columns,
+            n_rows=n_rows,
+            storage_options=storage_options,
+        )
+        df = _read_files(read, uri)
+        return df if n_rows is None else df.head(n_rows)
+    return pl.read_ipc(
+        uri, with_columns, n_rows=n_rows, storage_options=storage_options
+    )
 
 
 def _scan_ipc_fsspec(
     file: str,
     storage_options: dict[str, object] | None = None,
+    n_rows: int | None = None,
 ) -> pli.LazyFrame:
-    func = partial(_scan_ipc_impl, file)
+    storage_options = storage_options or {}
+    uri = _expand_fsspec_glob(file, storage_options)
+    # the row limit is applied by the reader, so no slice has to be added to the plan
+    func = partial(_scan_ipc_impl, uri, n_rows, storage_options)
     func_serialized = pickle.dumps(func)
 
-    storage_options = storage_options or {}
-    with pli._prepare_file_arg(file, **storage_options) as data:
+    # all files matched by a glob pattern are expected to share the same schema
+    schema_file = uri[0] if isinstance(uri, list) else uri
+    with pli._prepare_file_arg(schema_file, **storage_options) as data:
         schema = pli.read_ipc_schema(data)
 
     return pli.LazyFrame._scan_python_function(schema, func_serialized)
 
 
-def _scan_parquet_impl(uri: str, with_columns: list[str] | None) -> pli.DataFrame:
+def _scan_parquet_impl(
+    uri: str | list[str],
+    n_rows: int | None,
+    storage_options: dict[str, object],
+    with_columns: list[str] | None,
+) -> pli.DataFrame:
     """
     Take the projected columns and materialize an arrow table.
 
     Parameters
     ----------
     uri
-        Source URI
+        Source URI, or the URIs of all files matched by a glob pattern
+    n_rows
+        Stop reading after ``n_rows``
+    storage_options
+        Extra options passed to fsspec when reading the file(s)
     with_columns
         Columns that are projected
 
     """
     import polars as pl
 
-    return pl.read_parquet(uri, with_columns)
+    if isinstance(uri, list):
+        read = partial(
+            pl.read_parquet,
+            columns=with_columns,
+            n_rows=n_rows,
+            storage_options=storage_options,
+        )
+        df = _read_files(read, uri)
+        return df if n_rows is None else df.head(n_rows)
+    return pl.read_parquet(
+        uri, with_columns, n_rows=n_rows, storage_options=storage_options
+    )
 
 
 def _scan_parquet_fsspec(
     file: str,
     storage_options: dict[str, object] | None = None,
+    n_rows: int | None = None,
 ) -> pli.LazyFrame:
-    func = partial(_scan_parquet_impl, file)
+    storage_options = storage_options or {}
+    uri = _expand_fsspec_glob(file, storage_options)
+    # the row limit is applied by the reader, so no slice has to be added to the plan
+    func = partial(_scan_parquet_impl, uri, n_rows, storage_options)
     func_serialized = pickle.dumps(func)
 
-    storage_options = storage_options or {}
-    with pli._prepare_file_arg(file, **storage_options) as data:
+    # all files matched by a glob pattern are expected to share the same schema
+    schema_file = uri[0] if isinstance(uri, list) else uri
+    with pli._prepare_file_arg(schema_file, **storage_options) as data:
         schema = pli.read_parquet_schema(data)
 
     return pli.LazyFrame._scan_python_function(schema, func_serialized)
@@ -47,10 +47,17 @@ if TYPE_CHECKING:
 def selection_to_pyexpr_list(
     exprs: str | Expr | Sequence[str | Expr | pli.Series] | pli.Series,
 ) -> list[PyExpr]:
-    if isinstance(exprs, (str, Expr, pli.Series)):
+    if isinstance(exprs, str):
+        return [pli.col(exprs)._pyexpr]
+    if isinstance(exprs, (Expr, pli.Series)):
         exprs = [exprs]
 
-    return [expr_to_lit_or_expr(e, str_to_lit=False)._pyexpr for e in exprs]
+    return [
+        e._pyexpr
+        if isinstance(e, Expr)
+        else expr_to_lit_or_expr(e, str_to_lit=False)._pyexpr
+        for e in exprs
+    ]
 
 
 def ensure_list_of_pyexpr(exprs: object) -> list[PyExpr]:
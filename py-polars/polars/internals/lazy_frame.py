@@ -4,18 +4,14 @@ execution.
 """
 from __future__ import annotations
 
-import os
-import shutil
+import functools
 import subprocess
 import sys
-import tempfile
 import typing
 from io import BytesIO, IOBase, StringIO
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable, Generic, Sequence, TypeVar, overload
 
-from polars.internals.expr import ensure_list_of_pyexpr
-
 if sys.version_info >= (3, 8):
     from typing import Literal
 else:
@@ -23,6 +19,7 @@ else:
 
 try:
     from polars.polars import PyExpr, PyLazyFrame, PyLazyGroupBy
+    from polars.polars import col as pycol
 
     _DOCUMENTING = False
 except ImportError:
@@ -64,6 +61,10 @@ if TYPE_CHECKING:
 # including sub-classes.
 LDF = TypeVar("LDF", bound="LazyFrame")
 
+# default values of the arguments of `PyLazyFrame.optimization_toggle`, these match
+# the optimization state of a new LazyFrame
+_DEFAULT_OPTIMIZATIONS = (True, True, True, True, False, True)
+
 
 def wrap_ldf(ldf: PyLazyFrame) -> LazyFrame:
     return LazyFrame._from_pyldf(ldf)
@@ -72,25 +73,43 @@ def wrap_ldf(ldf: PyLazyFrame) -> LazyFrame:
 def _prepare_groupby_inputs(
     by: str | list[str] | pli.Expr | list[pli.Expr] | None,
 ) -> list[PyExpr]:
-    if isinstance(by, list):
-        new_by = []
-        for e in by:
-            if isinstance(e, str):
-                e = pli.col(e)
-            new_by.append(e._pyexpr)
+    if by is None:
+        return []
     elif isinstance(by, str):
-        new_by = [pli.col(by)._pyexpr]
+        return [pycol(by)]
+    elif isinstance(by, list):
+        return [pycol(e) if isinstance(e, str) else e._pyexpr for e in by]
     elif isinstance(by, pli.Expr):
-        new_by = [by._pyexpr]
-    elif by is None:
-        return []
-    return new_by
+        return [by._pyexpr]
+    raise TypeError(f"unexpected type '{type(by)}'")
+
+
+@functools.lru_cache(maxsize=2)
+def _render_dot(dot: str, fmt: str) -> bytes:
+    """
+    Render a dot graph with the graphviz binary.
+
+    The output is cached on the dot source, so that notebooks re-rendering the same
+    query plan don't spawn a new `dot` process every time. Only the last few renders
+    are kept, as the rendered images can be large.
+    """
+    return subprocess.check_output(
+        ["dot", "-Nshape=box", f"-T{fmt}"], input=dot.encode()
+    )
 
 
 class LazyFrame:
     """Representation of a Lazy computation graph/query."""
 
+    # `__dict__` and `__weakref__` keep the layout compatible with subclasses that do
+    # not declare slots, so `obj.__class__ = SubClass` keeps working; the dict is
+    # only allocated if such a subclass actually stores extra attributes
+    __slots__ = ("_ldf", "_schema", "__dict__", "__weakref__")
+
     _ldf: PyLazyFrame
+    # the schema of a query plan does not change, so it is resolved at most once;
+    # the slot stays unset until the first access
+    _schema: dict[str, type[DataType]]
 
     @classmethod
     def _from_pyldf(cls: type[LDF], ldf: PyLazyFrame) -> LDF:
@@ -134,10 +153,8 @@ class LazyFrame:
 
         """
         dtype_list: list[tuple[str, type[DataType]]] | None = None
-        if dtypes is not None:
-            dtype_list = []
-            for k, v in dtypes.items():
-                dtype_list.append((k, py_type_to_dtype(v)))
+        if dtypes:
+            dtype_list = [(k, py_type_to_dtype(v)) for k, v in dtypes.items()]
         processed_null_values = _process_null_values(null_values)
 
         self = cls.__new__(cls)
@@ -190,9 +207,7 @@ class LazyFrame:
         """
         # try fsspec scanner
         if not pli._is_local_file(file):
-            scan = pli._scan_parquet_fsspec(file, storage_options)
-            if n_rows:
-                scan = scan.head(n_rows)
+            scan = pli._scan_parquet_fsspec(file, storage_options, n_rows or None)
             if row_count_name is not None:
                 scan = scan.with_row_count(row_count_name, row_count_offset)
             return scan  # type: ignore[return-value]
@@ -231,9 +246,7 @@ class LazyFrame:
 
         # try fsspec scanner
         if not pli._is_local_file(file):
-            scan = pli._scan_ipc_fsspec(file, storage_options)
-            if n_rows:
-                scan = scan.head(n_rows)
+            scan = pli._scan_ipc_fsspec(file, storage_options, n_rows or None)
             if row_count_name is not None:
                 scan = scan.with_row_count(row_count_name, row_count_offset)
             return scan  # type: ignore[return-value]
@@ -256,8 +269,7 @@ class LazyFrame:
         --------
         read_json
         """
-        f = StringIO(json)
-        return cls.read_json(f)
+        return wrap_ldf(PyLazyFrame.read_json_from_str(json))
 
     @classmethod
     def read_json(
@@ -273,7 +285,7 @@ class LazyFrame:
 
         """
         if isinstance(file, StringIO):
-            file = BytesIO(file.getvalue().encode())
+            return wrap_ldf(PyLazyFrame.read_json_from_str(file.getvalue()))
         elif isinstance(file, (str, Path)):
             file = format_path(file)
 
@@ -327,20 +339,13 @@ class LazyFrame:
         read_json
 
         """
-        if isinstance(file, (str, Path)):
-            file = format_path(file)
-        to_string_io = (file is not None) and isinstance(file, StringIO)
-        if to_string or file is None or to_string_io:
-            with BytesIO() as buf:
-                self._ldf.write_json(buf)
-                json_bytes = buf.getvalue()
-
-            json_str = json_bytes.decode("utf8")
-            if to_string_io:
-                file.write(json_str)  # type: ignore[union-attr]
-            else:
-                return json_str
+        if to_string or file is None:
+            return self._ldf.write_json_to_string()
+        elif isinstance(file, StringIO):
+            file.write(self._ldf.write_json_to_string())
         else:
+            if isinstance(file, (str, Path)):
+                file = format_path(file)
             self._ldf.write_json(file)
         return None
 
@@ -368,7 +373,7 @@ class LazyFrame:
         return LazyPolarsSlice(self).apply(item)
 
     def __contains__(self: LDF, key: str) -> bool:
-        return key in self.columns
+        return key in self._get_schema()
 
     def pipe(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
         """
@@ -410,10 +415,7 @@ class LazyFrame:
 
     def _repr_html_(self) -> str:
         try:
-            dot = self._ldf.to_dot(optimized=False)
-            svg = subprocess.check_output(
-                ["dot", "-Nshape=box", "-Tsvg"], input=f"{dot}".encode()
-            )
+            svg = _render_dot(self._ldf.to_dot(optimized=False), "svg")
             return (
                 "<h4>NAIVE QUERY PLAN</h4><p>run <b>LazyFrame.show_graph()</b> to see"
                 f" the optimized version</p>{svg.decode()}"
@@ -447,7 +449,7 @@ naive plan: (run LazyFrame.describe_optimized_plan() to see the optimized plan)
         slice_pushdown: bool = True,
     ) -> str:
         """Create a string representation of the optimized query plan."""
-        ldf = self._ldf.optimization_toggle(
+        ldf = self._optimization_toggle(
             type_coercion,
             predicate_pushdown,
             projection_pushdown,
@@ -458,6 +460,28 @@ naive plan: (run LazyFrame.describe_optimized_plan() to see the optimized plan)
 
         return ldf.describe_optimized_plan()
 
+    def _optimization_toggle(
+        self,
+        type_coercion: bool,
+        predicate_pushdown: bool,
+        projection_pushdown: bool,
+        simplify_expression: bool,
+        string_cache: bool,
+        slice_pushdown: bool,
+    ) -> PyLazyFrame:
+        """Set the optimizations; the binary is only called if any is non-default."""
+        toggles = (
+            type_coercion,
+            predicate_pushdown,
+            projection_pushdown,
+            simplify_expression,
+            string_cache,
+            slice_pushdown,
+        )
+        if toggles == _DEFAULT_OPTIMIZATIONS:
+            return self._ldf
+        return self._ldf.optimization_toggle(*toggles)
+
     def show_graph(
         self,
         optimized: bool = True,
@@ -469,6 +493,9 @@ naive plan: (run LazyFrame.describe_optimized_plan() to see the optimized plan)
         """
         Show a plot of the query plan. Note that you should have graphviz installed.
 
+        If the graphviz ``dot`` binary fails to render the plan outside of a notebook,
+        a ``subprocess.CalledProcessError`` is raised.
+
         Parameters
         ----------
         optimized
@@ -490,10 +517,7 @@ naive plan: (run LazyFrame.describe_optimized_plan() to see the optimized plan)
             try:
                 from IPython.display import SVG, display
 
-                dot = self._ldf.to_dot(optimized)
-                svg = subprocess.check_output(
-                    ["dot", "-Nshape=box", "-Tsvg"], input=f"{dot}".encode()
-                )
+                svg = _render_dot(self._ldf.to_dot(optimized), "svg")
                 return display(SVG(svg))
             except Exception as exc:
                 raise ImportError(
@@ -511,22 +535,17 @@ naive plan: (run LazyFrame.describe_optimized_plan() to see the optimized plan)
         dot = self._ldf.to_dot(optimized)
         if raw_output:
             return dot
-        with tempfile.TemporaryDirectory() as tmpdir_name:
-            dot_path = os.path.join(tmpdir_name, "dot")
-            with open(dot_path, "w", encoding="utf8") as f:
-                f.write(dot)
-
-            subprocess.run(["dot", "-Nshape=box", "-Tpng", "-O", dot_path])
-            out_path = os.path.join(tmpdir_name, "dot.png")
-
-            if output_path is not None:
-                shutil.copy(out_path, output_path)
-
-            if show:
-                plt.figure(figsize=figsize)
-                img = mpimg.imread(out_path)
-                plt.imshow(img)
-                plt.show()
+        png = _render_dot(dot, "png")
+
+        if output_path is not None:
+            with open(output_path, "wb") as f:
+                f.write(png)
+
+        if show:
+            plt.figure(figsize=figsize)
+            img = mpimg.imread(BytesIO(png), format="png")
+            plt.imshow(img)
+            plt.show()
         return None
 
     def inspect(self: LDF, fmt: str = "{}") -> LDF:
@@ -577,9 +596,9 @@ naive plan: (run LazyFrame.describe_optimized_plan() to see the optimized plan)
             Place null values last. Can only be used if sorted by a single column.
 
         """
-        if type(by) is str:
-            return self._from_pyldf(self._ldf.sort(by, reverse, nulls_last))
         if type(reverse) is bool:
+            if type(by) is str:
+                return self._from_pyldf(self._ldf.sort(by, reverse, nulls_last))
             reverse = [reverse]
 
         by = pli.selection_to_pyexpr_list(by)
@@ -634,7 +653,7 @@ naive plan: (run LazyFrame.describe_optimized_plan() to see the optimized plan)
             predicate_pushdown = False
             projection_pushdown = False
 
-        ldf = self._ldf.optimization_toggle(
+        ldf = self._optimization_toggle(
             type_coercion,
             predicate_pushdown,
             projection_pushdown,
@@ -696,7 +715,7 @@ naive plan: (run LazyFrame.describe_optimized_plan() to see the optimized plan)
             projection_pushdown = False
             slice_pushdown = False
 
-        ldf = self._ldf.optimization_toggle(
+        ldf = self._optimization_toggle(
             type_coercion,
             predicate_pushdown,
             projection_pushdown,
@@ -743,7 +762,7 @@ naive plan: (run LazyFrame.describe_optimized_plan() to see the optimized plan)
         ['foo', 'bar']
 
         """
-        return self._ldf.columns()
+        return list(self._get_schema())
 
     @property
     def dtypes(self) -> list[type[DataType]]:
@@ -767,7 +786,7 @@ naive plan: (run LazyFrame.describe_optimized_plan() to see the optimized plan)
         schema : Returns a {colname:dtype} mapping.
 
         """  # noqa: E501
-        return self._ldf.dtypes()
+        return list(self._get_schema().values())
 
     @property
     def schema(self) -> dict[str, type[DataType]]:
@@ -787,7 +806,15 @@ naive plan: (run LazyFrame.describe_optimized_plan() to see the optimized plan)
         {'foo': <class 'polars.datatypes.Int64'>, 'bar': <class 'polars.datatypes.Float64'>, 'ham': <class 'polars.datatypes.Utf8'>}
 
         """  # noqa: E501
-        return self._ldf.schema()
+        return dict(self._get_schema())
+
+    def _get_schema(self) -> dict[str, type[DataType]]:
+        """Get the schema, resolving it only on first access."""
+        try:
+            return self._schema
+        except AttributeError:
+            self._schema = self._ldf.schema()
+            return self._schema
 
     def cache(self: LDF) -> LDF:
         """Cache the result once the execution of the physical plan hits this node."""
@@ -822,7 +849,7 @@ naive plan: (run LazyFrame.describe_optimized_plan() to see the optimized plan)
         └─────┴─────┴──────┘
 
         """
-        return pli.DataFrame(columns=self.schema).lazy()
+        return self._from_pyldf(self._ldf.cleared())
 
     def clone(self: LDF) -> LDF:
         """
@@ -888,6 +915,8 @@ naive plan: (run LazyFrame.describe_optimized_plan() to see the optimized plan)
         └─────┴─────┴─────┘
 
         """
+        if type(predicate) is pli.Expr:
+            return self._from_pyldf(self._ldf.filter(predicate._pyexpr))
         if isinstance(predicate, list):
             predicate = pli.Series(predicate)
 
@@ -933,6 +962,19 @@ naive plan: (run LazyFrame.describe_optimized_plan() to see the optimized plan)
         └─────┘
 
         """
+        if (
+            isinstance(exprs, list)
+            and exprs
+            and all(
+                type(name) is str
+                and name != "*"
+                and not (name.startswith("^") and name.endswith("$"))
+                for name in exprs
+            )
+        ):
+            # plain column subset: a single multi-column expression is
+            # expanded on the rust side, no per-name python expressions needed
+            return self._from_pyldf(self._ldf.select([pli.col(exprs)._pyexpr]))
         exprs = pli.selection_to_pyexpr_list(exprs)
         return self._from_pyldf(self._ldf.select(exprs))
 
@@ -1441,25 +1483,25 @@ naive plan: (run LazyFrame.describe_optimized_plan() to see the optimized plan)
             right_on_ = right_on
 
         if isinstance(on, (str, pli.Expr)):
-            left_on_ = [on]
-            right_on_ = [on]
+            left_on_ = right_on_ = [on]
         elif isinstance(on, list):
-            left_on_ = on
-            right_on_ = on
+            left_on_ = right_on_ = on
 
         if left_on_ is None or right_on_ is None:
             raise ValueError("You should pass the column to join on as an argument.")
 
-        new_left_on = []
-        for column in left_on_:
-            if isinstance(column, str):
-                column = pli.col(column)
-            new_left_on.append(column._pyexpr)
-        new_right_on = []
-        for column in right_on_:
-            if isinstance(column, str):
-                column = pli.col(column)
-            new_right_on.append(column._pyexpr)
+        new_left_on = [
+            pycol(column) if isinstance(column, str) else column._pyexpr
+            for column in left_on_
+        ]
+        if right_on_ is left_on_:
+            # joining on the same columns, no need to build the expressions twice
+            new_right_on = new_left_on
+        else:
+            new_right_on = [
+                pycol(column) if isinstance(column, str) else column._pyexpr
+                for column in right_on_
+            ]
 
         return self._from_pyldf(
             self._ldf.join(
@@ -1636,6 +1678,8 @@ naive plan: (run LazyFrame.describe_optimized_plan() to see the optimized plan)
         └──────┴─────┘
 
         """
+        if isinstance(expr, pli.Expr):
+            return self._from_pyldf(self._ldf.with_columns([expr._pyexpr]))
         return self.with_columns([expr])
 
     def drop(self: LDF, columns: str | list[str]) -> LDF:
@@ -1820,9 +1864,11 @@ naive plan: (run LazyFrame.describe_optimized_plan() to see the optimized plan)
         Limit the LazyFrame to the first `n` rows.
 
         .. note::
+            The optimizer pushes the slice down to the scan level where the query
+            allows it, so that no more than `n` rows are read from the source.
             Consider using the :func:`fetch` operation when you only want to test your
-            query. The :func:`fetch` operation will load the first `n` rows at the scan
-            level, whereas the :func:`head`/:func:`limit` are applied at the end.
+            query. The :func:`fetch` operation loads the first `n` rows of every scan,
+            also when the result depends on more rows (e.g. after a filter).
 
         Parameters
         ----------
@@ -1837,12 +1883,11 @@ naive plan: (run LazyFrame.describe_optimized_plan() to see the optimized plan)
         Get the first `n` rows of the DataFrame.
 
         .. note::
+            The optimizer pushes the slice down to the scan level where the query
+            allows it, so that no more than `n` rows are read from the source.
             Consider using the :func:`fetch` operation when you only want to test your
-            query. The :func:`fetch` operation will load the first `n` rows at the scan
-            level, whereas the :func:`head`/:func:`limit` are applied at the end.
-
-        This operation instead loads all the rows and only applies the ``head`` at the
-        end.
+            query. The :func:`fetch` operation loads the first `n` rows of every scan,
+            also when the result depends on more rows (e.g. after a filter).
 
         Parameters
         ----------
@@ -2018,6 +2063,47 @@ naive plan: (run LazyFrame.describe_optimized_plan() to see the optimized plan)
         """
         return self._from_pyldf(self._ldf.quantile(quantile, interpolation))
 
+    def aggregate_many(self: LDF, kinds: str | Sequence[str]) -> LDF:
+        """
+        Aggregate the columns in the DataFrame to several summary statistics at once.
+
+        All aggregations are computed in a single projection, so the input is only
+        scanned once instead of once per statistic. The output columns are named
+        ``"{column}_{kind}"``.
+
+        Parameters
+        ----------
+        kinds : {'max', 'min', 'sum', 'mean', 'median', 'std', 'var'}
+            Aggregation or list of aggregations to compute.
+
+        Examples
+        --------
+        >>> df = pl.DataFrame(
+        ...     {
+        ...         "a": [1, 2, 3],
+        ...         "b": [4, 5, 6],
+        ...     }
+        ... ).lazy()
+        >>> df.aggregate_many(["min", "max"]).collect()
+        shape: (1, 4)
+        ┌───────┬───────┬───────┬───────┐
+        │ a_min ┆ b_min ┆ a_max ┆ b_max │
+        │ ---   ┆ ---   ┆ ---   ┆ ---   │
+        │ i64   ┆ i64   ┆ i64   ┆ i64   │
+        ╞═══════╪═══════╪═══════╪═══════╡
+        │ 1     ┆ 4     ┆ 3     ┆ 6     │
+        └───────┴───────┴───────┴───────┘
+
+        """
+        if isinstance(kinds, str):
+            kinds = [kinds]
+        exprs = []
+        for kind in kinds:
+            if kind not in ("max", "min", "sum", "mean", "median", "std", "var"):
+                raise ValueError(f"Unsupported aggregation {kind!r}")
+            exprs.append(getattr(pli.all(), kind)().suffix(f"_{kind}"))
+        return self.select(exprs)
+
     def explode(
         self: LDF,
         columns: str | list[str] | pli.Expr | list[pli.Expr],
@@ -2108,7 +2194,7 @@ naive plan: (run LazyFrame.describe_optimized_plan() to see the optimized plan)
         DataFrame with unique rows
 
         """
-        if subset is not None and not isinstance(subset, list):
+        if isinstance(subset, str):
             subset = [subset]
         return self._from_pyldf(self._ldf.unique(maintain_order, subset, keep))
 
@@ -2193,7 +2279,7 @@ naive plan: (run LazyFrame.describe_optimized_plan() to see the optimized plan)
         └──────┴─────┴──────┘
 
         """
-        if subset is not None and not isinstance(subset, list):
+        if isinstance(subset, str):
             subset = [subset]
         return self._from_pyldf(self._ldf.drop_nulls(subset))
 
@@ -2391,9 +2477,12 @@ naive plan: (run LazyFrame.describe_optimized_plan() to see the optimized plan)
 class LazyGroupBy(Generic[LDF]):
     """Created by `df.lazy().groupby("foo)"`."""
 
+    __slots__ = ("lgb", "_lazyframe_class", "_wrap")
+
     def __init__(self, lgb: PyLazyGroupBy, lazyframe_class: type[LDF]) -> None:
         self.lgb = lgb
         self._lazyframe_class = lazyframe_class
+        self._wrap: Callable[[PyLazyFrame], LDF] = lazyframe_class._from_pyldf
 
     def agg(self, aggs: pli.Expr | Sequence[pli.Expr]) -> LDF:
         """
@@ -2422,8 +2511,13 @@ class LazyGroupBy(Generic[LDF]):
             msg = f"expected 'Expr | Sequence[Expr]', got '{type(aggs)}'"
             raise TypeError(msg)
 
-        pyexprs = ensure_list_of_pyexpr(aggs)
-        return self._lazyframe_class._from_pyldf(self.lgb.agg(pyexprs))
+        # the guard above already validated every element, so unwrap directly
+        # instead of re-checking the sequence in `ensure_list_of_pyexpr`
+        if isinstance(aggs, pli.Expr):
+            pyexprs = [aggs._pyexpr]
+        else:
+            pyexprs = [e._pyexpr for e in aggs]
+        return self._wrap(self.lgb.agg(pyexprs))
 
     def head(self, n: int = 5) -> LDF:
         """
@@ -2480,7 +2574,7 @@ class LazyGroupBy(Generic[LDF]):
         └─────────┴─────┘
 
         """
-        return self._lazyframe_class._from_pyldf(self.lgb.head(n))
+        return self._wrap(self.lgb.head(n))
 
     def tail(self, n: int = 5) -> LDF:
         """
@@ -2537,7 +2631,7 @@ class LazyGroupBy(Generic[LDF]):
         └─────────┴─────┘
 
         """
-        return self._lazyframe_class._from_pyldf(self.lgb.tail(n))
+        return self._wrap(self.lgb.tail(n))
 
     def apply(self, f: Callable[[pli.DataFrame], pli.DataFrame]) -> LDF:
         """
@@ -2601,4 +2695,4 @@ class LazyGroupBy(Generic[LDF]):
         ... )  # doctest: +IGNORE_RESULT
 
         """
-        return self._lazyframe_class._from_pyldf(self.lgb.apply(f))
+        return self._wrap(self.lgb.apply(f))
@@ -158,6 +158,11 @@ def col(
     └───────────┴─────┘
 
     """
+    # fast path for the common case of a single column name; this is also what the
+    # builtin shadowing functions (`pl.sum("a")`, `pl.max("a")`, ...) end up calling
+    if type(name) is str:
+        return pli.wrap_expr(pycol(name))
+
     if isinstance(name, pli.Series):
         name = name.to_list()  # type: ignore[assignment]
 
@@ -269,7 +274,9 @@ def count(column: str | pli.Series | None = None) -> pli.Expr | int:
     return col(column).count()
 
 
-def to_list(name: str) -> pli.Expr:
+def to_list(
+    name: str | list[str] | Sequence[PolarsDataType] | PolarsDataType,
+) -> pli.Expr:
     """
     Aggregate to list.
 
@@ -8,9 +8,8 @@ import sys
 import warnings
 from datetime import date, datetime, time, timedelta, timezone
 from pathlib import Path
-from typing import Any, Callable, Iterable, Sequence, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Sequence, TypeVar
 
-import polars.internals as pli
 from polars.datatypes import DataType, Date, Datetime
 
 try:
@@ -33,6 +32,9 @@ if sys.version_info >= (3, 10):
 else:
     from typing_extensions import ParamSpec, TypeGuard
 
+if TYPE_CHECKING:
+    import polars.internals as pli
+
 
 def _process_null_values(
     null_values: None | str | list[str] | dict[str, str] = None,
@@ -140,8 +142,12 @@ def is_int_sequence(val: object) -> TypeGuard[Sequence[int]]:
 
 def is_expr_sequence(val: object) -> TypeGuard[Sequence[pli.Expr]]:
     """Check whether the given object is a sequence of Exprs."""
+    # imported here, as `polars.internals` itself imports this module; a top-level
+    # import breaks `import polars.utils` when it is the first polars import
+    from polars.internals.expr import Expr
+
     if isinstance(val, Sequence):
-        return _is_iterable_of(val, pli.Expr)
+        return _is_iterable_of(val, Expr)
     else:
         return False
 
@@ -263,6 +269,7 @@ def _to_python_datetime(
         raise NotImplementedError  # pragma: no cover
 
 
+@functools.lru_cache(maxsize=1)
 def _in_notebook() -> bool:
     try:
         from IPython import get_ipython
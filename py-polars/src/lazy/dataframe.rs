@@ -2,11 +2,11 @@ use crate::arrow_interop::to_rust::pyarrow_schema_to_rust;
 use crate::conversion::Wrap;
 use crate::dataframe::PyDataFrame;
 use crate::error::PyPolarsErr;
-use crate::file::get_file_like;
+use crate::file::{get_either_file, get_file_like, EitherRustPythonFile};
 use crate::lazy::{dsl::PyExpr, utils::py_exprs_to_exprs};
 use crate::prelude::*;
 use polars::io::RowCount;
-use polars::lazy::frame::{AllowedOptimizations, LazyCsvReader, LazyFrame, LazyGroupBy};
+use polars::lazy::frame::{AllowedOptimizations, IntoLazy, LazyCsvReader, LazyFrame, LazyGroupBy};
 use polars::lazy::prelude::col;
 use polars::prelude::{ClosedWindow, CsvEncoding, DataFrame, Field, JoinType, Schema};
 use polars::time::*;
@@ -16,7 +16,7 @@ use polars_core::prelude::*;
 use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
 use pyo3::types::{PyDict, PyList};
-use std::io::BufWriter;
+use std::io::{BufWriter, Write};
 
 #[pyclass]
 #[repr(transparent)]
@@ -97,17 +97,45 @@ impl From<LazyFrame> for PyLazyFrame {
     }
 }
 
+#[cfg(all(feature = "json", feature = "serde_json"))]
+fn serde_err(err: serde_json::Error) -> PyErr {
+    PyValueError::new_err(format!("{:?}", err))
+}
+
+/// Serialize the plan and flush the writer, so that write errors are not lost on drop.
+#[cfg(all(feature = "json", feature = "serde_json"))]
+fn write_plan_json<W: Write>(f: W, lp: &LogicalPlan) -> PyResult<()> {
+    let mut file = BufWriter::new(f);
+    serde_json::to_writer(&mut file, lp).map_err(serde_err)?;
+    file.flush()
+        .map_err(|err| PyPolarsErr::from(PolarsError::from(err)))?;
+    Ok(())
+}
+
 #[pymethods]
 #[allow(clippy::should_implement_trait)]
 impl PyLazyFrame {
     #[cfg(all(feature = "json", feature = "serde_json"))]
-    pub fn write_json(&self, py_f: PyObject) -> PyResult<()> {
-        let file = BufWriter::new(get_file_like(py_f, true)?);
-        serde_json::to_writer(file, &self.ldf.logical_plan)
-            .map_err(|err| PyValueError::new_err(format!("{:?}", err)))?;
+    pub fn write_json(&self, py: Python, py_f: PyObject) -> PyResult<()> {
+        match get_either_file(py_f, true)? {
+            // a file on disk: serialize and write without holding the GIL.
+            // The plan is moved into the closure, so it only needs to be `Send`,
+            // which `#[pyclass]` already requires of `PyLazyFrame`.
+            EitherRustPythonFile::Rust(f) => {
+                let lp = self.ldf.logical_plan.clone();
+                py.allow_threads(move || write_plan_json(f.into_inner(), &lp))?
+            }
+            EitherRustPythonFile::Py(f) => write_plan_json(f, &self.ldf.logical_plan)?,
+        }
         Ok(())
     }
 
+    #[cfg(all(feature = "json", feature = "serde_json"))]
+    pub fn write_json_to_string(&self) -> PyResult<String> {
+        let json = serde_json::to_string(&self.ldf.logical_plan).map_err(serde_err)?;
+        Ok(json)
+    }
+
     #[staticmethod]
     #[cfg(feature = "json")]
     pub fn read_json(py_f: PyObject) -> PyResult<Self> {
@@ -117,14 +145,19 @@ impl PyLazyFrame {
         let _ = get_file_like(py_f, false)?
             .read_to_string(&mut json)
             .unwrap();
+        Self::read_json_from_str(&json)
+    }
 
+    #[staticmethod]
+    #[cfg(feature = "json")]
+    pub fn read_json_from_str(json: &str) -> PyResult<Self> {
         // Safety
         // we skipped the serializing/deserializing of the static in lifetime in `DataType`
         // so we actually don't have a lifetime at all when serializing.
 
         // &str still has a lifetime. Bit its ok, because we drop it immediately
         // in this scope
-        let json = unsafe { std::mem::transmute::<&'_ str, &'static str>(json.as_str()) };
+        let json = unsafe { std::mem::transmute::<&'_ str, &'static str>(json) };
 
         let lp = serde_json::from_str::<LogicalPlan>(json)
             .map_err(|err| PyValueError::new_err(format!("{:?}", err)))?;
@@ -745,8 +778,13 @@ impl PyLazyFrame {
         self.ldf.clone().into()
     }
 
-    pub fn columns(&self) -> PyResult<Vec<String>> {
-        Ok(self.get_schema()?.iter_names().cloned().collect())
+    pub fn cleared(&self) -> PyResult<PyLazyFrame> {
+        let schema = self.get_schema()?;
+        let columns = schema
+            .iter_fields()
+            .map(|fld| Series::new_empty(fld.name(), fld.data_type()))
+            .collect();
+        Ok(DataFrame::new_no_checks(columns).lazy().into())
     }
 
     pub fn dtypes(&self, py: Python) -> PyResult<PyObject> {
@@ -761,9 +799,9 @@ impl PyLazyFrame {
         let schema = self.get_schema()?;
         let schema_dict = PyDict::new(py);
 
-        schema.iter_fields().for_each(|fld| {
+        schema.iter().for_each(|(name, dtype)| {
             schema_dict
-                .set_item(fld.name(), Wrap(fld.data_type().clone()))
+                .set_item(name.as_str(), Wrap(dtype.clone()))
                 .unwrap()
         });
         Ok(schema_dict.to_object(py))
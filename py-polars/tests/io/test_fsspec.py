@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import io
+from functools import partial
+from typing import Any, Iterator
+
+import pytest
+
+import polars as pl
+from polars.internals.anonymous_scan import _expand_fsspec_glob, _read_files
+from polars.testing import assert_frame_equal
+
+fsspec = pytest.importorskip("fsspec")
+
+ROOT = "memory://polars-fsspec-test"
+
+
+@pytest.fixture
+def memfs() -> Iterator[Any]:
+    fs = fsspec.filesystem("memory")
+    yield fs
+    if fs.exists("/polars-fsspec-test"):
+        fs.rm("/polars-fsspec-test", recursive=True)
+
+
+def _write(fs: Any, name: str, df: pl.DataFrame) -> None:
+    buf = io.BytesIO()
+    if name.endswith(".parquet"):
+        df.write_parquet(buf)
+    elif name.endswith(".ipc"):
+        df.write_ipc(buf)
+    else:
+        df.write_csv(buf)
+    fs.pipe(f"{ROOT}/{name}", buf.getvalue())
+
+
+@pytest.fixture
+def frames(memfs: Any) -> tuple[pl.DataFrame, pl.DataFrame]:
+    df1 = pl.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+    df2 = pl.DataFrame({"a": [4, 5], "b": ["v", "w"]})
+    for ext in ("parquet", "ipc", "csv"):
+        _write(memfs, f"part-1.{ext}", df1)
+        _write(memfs, f"part-2.{ext}", df2)
+    return df1, df2
+
+
+@pytest.mark.parametrize("scan", [pl.scan_parquet, pl.scan_ipc])
+def test_scan_fsspec_glob(scan: Any, frames: tuple[pl.DataFrame, pl.DataFrame]) -> None:
+    ext = "parquet" if scan is pl.scan_parquet else "ipc"
+    expected = pl.concat(frames)
+
+    out = scan(f"{ROOT}/part-*.{ext}").collect()
+    assert_frame_equal(out, expected)
+
+    out = scan(f"{ROOT}/part-*.{ext}").select("b").collect()
+    assert_frame_equal(out, expected.select("b"))
+
+    out = scan(f"{ROOT}/part-*.{ext}", n_rows=4).collect()
+    assert_frame_equal(out, expected.head(4))
+
+    # a single file still goes through the non-glob path
+    out = scan(f"{ROOT}/part-2.{ext}").collect()
+    assert_frame_equal(out, frames[1])
+
+
+def test_read_files_csv_glob(frames: tuple[pl.DataFrame, pl.DataFrame]) -> None:
+    uris = _expand_fsspec_glob(f"{ROOT}/part-*.csv", {})
+    assert isinstance(uris, list)
+    assert [uri.rsplit("/", 1)[1] for uri in uris] == ["part-1.csv", "part-2.csv"]
+    read = partial(pl.read_csv, storage_options={})
+    assert_frame_equal(_read_files(read, uris), pl.concat(frames))
+
+
+@pytest.mark.parametrize("scan", [pl.scan_parquet, pl.scan_ipc])
+def test_scan_fsspec_glob_no_match(memfs: Any, scan: Any) -> None:
+    with pytest.raises(FileNotFoundError, match="no files found matching"):
+        scan(f"{ROOT}/missing-*.parquet")
+
+
+def test_expand_fsspec_glob_literals(memfs: Any) -> None:
+    df = pl.DataFrame({"a": [1]})
+    # an existing key with glob characters is read as is
+    _write(memfs, "part[1].parquet", df)
+    assert _expand_fsspec_glob(f"{ROOT}/part[1].parquet", {}) == (
+        f"{ROOT}/part[1].parquet"
+    )
+    assert_frame_equal(pl.scan_parquet(f"{ROOT}/part[1].parquet").collect(), df)
+    # the query string of a (presigned) url is not a glob pattern
+    url = "https://example.com/data.parquet?X-Amz-Signature=abc"
+    assert _expand_fsspec_glob(url, {}) == url
+
+
+def test_scan_fsspec_storage_options(
+    monkeypatch: pytest.MonkeyPatch, frames: tuple[pl.DataFrame, pl.DataFrame]
+) -> None:
+    seen: list[object] = []
+    read_parquet = pl.read_parquet
+
+    def spy(*args: Any, **kwargs: Any) -> pl.DataFrame:
+        seen.append(kwargs.get("storage_options"))
+        return read_parquet(*args, **kwargs)
+
+    monkeypatch.setattr(pl, "read_parquet", spy)
+    options: dict[str, object] = {"skip_instance_cache": True}
+    pl.scan_parquet(f"{ROOT}/part-*.parquet", storage_options=options).collect()
+    pl.scan_parquet(f"{ROOT}/part-1.parquet", storage_options=options).collect()
+    assert seen == [options] * 3
@@ -0,0 +1,30 @@
+import subprocess
+import sys
+
+import pytest
+
+SUBMODULES = ["convert", "datatypes", "exceptions", "internals", "io", "utils"]
+
+
+def _run(code: str) -> None:
+    # run in a fresh interpreter, so that no other test has imported the submodule
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+@pytest.mark.parametrize("name", SUBMODULES)
+def test_submodule_attributes_after_bare_import(name: str) -> None:
+    _run(f"import polars as pl; assert pl.{name}.__name__ == 'polars.{name}'")
+
+
+@pytest.mark.parametrize("name", SUBMODULES)
+def test_submodule_as_first_import(name: str) -> None:
+    _run(f"import polars.{name}")
+
+
+def test_lazy_attributes() -> None:
+    _run(
+        "import polars as pl; "
+        "assert pl.datatypes.Int8 is pl.Int8; "
+        "assert pl.internals.series.Series is pl.Series; "
+        "assert 'internals' in dir(pl)"
+    )
@@ -1104,6 +1104,19 @@ def test_quantile(fruits_cars: pl.DataFrame) -> None:
     assert fruits_cars.select(pl.col("A").quantile(0.24, "linear"))["A"][0] == 1.96
 
 
+def test_aggregate_many(fruits_cars: pl.DataFrame) -> None:
+    out = fruits_cars.lazy().select(["A", "B"]).aggregate_many(["min", "max"])
+    assert out.collect().to_dict(False) == {
+        "A_min": [1],
+        "B_min": [1],
+        "A_max": [5],
+        "B_max": [5],
+    }
+    assert fruits_cars.lazy().aggregate_many("median").collect()["A_median"][0] == 3
+    with pytest.raises(ValueError):
+        fruits_cars.lazy().aggregate_many(["foo"])
+
+
 def test_is_between(fruits_cars: pl.DataFrame) -> None:
     result = fruits_cars.select(pl.col("A").is_between(2, 4))["is_between"]
     assert result.series_equal(
@@ -1412,3 +1425,26 @@ def test_all_any_accept_expr() -> None:
         "null_in_row": [False, True, True],
         "all_null_in_row": [False, False, False],
     }
+
+
+def test_lazy_schema_is_cached() -> None:
+    ldf = pl.DataFrame({"a": [1, 2], "b": ["x", "y"]}).lazy()
+    assert ldf.schema == {"a": pl.Int64, "b": pl.Utf8}
+
+    # mutating the returned objects must not leak into the cached schema
+    ldf.schema["c"] = pl.Float64
+    ldf.columns.append("c")
+    assert ldf.columns == ["a", "b"]
+    assert ldf.dtypes == [pl.Int64, pl.Utf8]
+    assert "a" in ldf
+    assert "c" not in ldf
+
+    # derived frames resolve their own schema
+    assert ldf.select("a").schema == {"a": pl.Int64}
+
+
+def test_lazy_select_column_names() -> None:
+    ldf = pl.DataFrame({"a": [1], "b": [2], "c": [3]}).lazy()
+    assert ldf.select(["c", "a"]).collect().columns == ["c", "a"]
+    assert ldf.select(["^a|b$", "c"]).collect().columns == ["a", "b", "c"]
+    assert ldf.select(["*"]).collect().columns == ["a", "b", "c"]
@@ -402,3 +402,16 @@ def test_arr_contains_categorical() -> None:
     assert df_groups.filter(pl.col("str_list").arr.contains("C")).collect().to_dict(
         False
     ) == {"group": [2], "str_list": [["A", "C"]]}
+
+
+def test_pl_list_multiple_inputs() -> None:
+    df = pl.DataFrame({"a": [1, 2], "b": [3, 4], "c": ["x", "y"]})
+    assert df.select(pl.list(["a", "b"])).to_dict(False) == {
+        "a": [[1, 2]],
+        "b": [[3, 4]],
+    }
+    assert df.select(pl.list(pl.Int64)).to_dict(False) == {
+        "a": [[1, 2]],
+        "b": [[3, 4]],
+    }
+    assert df.select(pl.list("c")).to_dict(False) == {"c": [["x", "y"]]}
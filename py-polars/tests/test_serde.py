@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import pickle
+from io import StringIO
+from pathlib import Path
 
 import polars as pl
+from polars.testing import assert_frame_equal
 
 
 def test_pickling_simple_expression() -> None:
@@ -11,7 +14,7 @@ def test_pickling_simple_expression() -> None:
     assert str(pickle.loads(buf)) == str(e)
 
 
-def serde_lazy_frame_lp() -> None:
+def test_serde_lazy_frame_lp() -> None:
     lf = pl.DataFrame({"a": [1, 2, 3], "b": ["a", "b", "c"]}).lazy().select(pl.col("a"))
     json = lf.write_json(to_string=True)
 
@@ -21,3 +24,33 @@ def serde_lazy_frame_lp() -> None:
         .to_series()
         .series_equal(pl.Series("a", [1, 2, 3]))
     )
+
+
+def test_lazy_frame_json_round_trip() -> None:
+    lf = (
+        pl.DataFrame({"a": [1, 2, 3], "b": ["a", "b", "c"]})
+        .lazy()
+        .filter(pl.col("a") > 1)
+        .with_column((pl.col("a") * 2).alias("c"))
+    )
+    expected = lf.collect()
+
+    json = lf.write_json(to_string=True)
+    assert_frame_equal(pl.LazyFrame.from_json(json).collect(), expected)
+    assert lf.write_json() == json
+
+    buf = StringIO()
+    lf.write_json(buf)
+    assert buf.getvalue() == json
+    buf.seek(0)
+    assert_frame_equal(pl.LazyFrame.read_json(buf).collect(), expected)
+    assert_frame_equal(pl.LazyFrame.read_json(StringIO(json)).collect(), expected)
+
+
+def test_lazy_frame_json_file_round_trip(tmp_path: Path) -> None:
+    lf = pl.DataFrame({"a": [1, 2, 3]}).lazy().select(pl.col("a").sum())
+    file = tmp_path / "lp.json"
+    lf.write_json(file)
+    assert file.read_text() == lf.write_json(to_string=True)
+    assert_frame_equal(pl.LazyFrame.read_json(file).collect(), lf.collect())
+    assert_frame_equal(pl.LazyFrame.read_json(str(file)).collect(), lf.collect())
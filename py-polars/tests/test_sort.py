@@ -189,3 +189,10 @@ def test_sorted_join_and_dtypes() -> None:
         "row_nr": [0, 1, 2, 3, 4, 5],
         "a": [-5, -2, 3, 3, 9, 10],
     }
+
+
+def test_lazy_sort_by_name_with_reverse_list() -> None:
+    ldf = pl.DataFrame({"a": [2, 1, 3], "b": [1, 2, 3]}).lazy()
+    assert ldf.sort("a", reverse=[True]).collect()["a"].to_list() == [3, 2, 1]
+    assert ldf.sort("a", reverse=True).collect()["a"].to_list() == [3, 2, 1]
+    assert ldf.sort(["a", "b"], reverse=True).collect()["a"].to_list() == [3, 2, 1]